@@ -11,9 +11,12 @@ The actual bot file is likely much longer - this shows the essential parts.
 """
 
 import logging
+import math
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 import MetaTrader5 as mt5
-from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 # NEW IMPORTS for v4.1
 from risk_manager import RiskManager
@@ -34,11 +37,37 @@ class BennerBotV41:
         # Load configuration from .env
         self.config = load_config()
         
+        # Configured symbols are static for the process lifetime - parse once
+        self._all_mean_reversion_symbols = tuple(
+            s.strip() for s in self.config['MEAN_REVERSION_SYMBOLS'].split(',')
+        )
+        
         # EXISTING COMPONENTS (your current bot)
         self.account_info = None
         self.positions = []
         self.pending_orders = []
         
+        # Positions snapshot, reused across cycles until it is older than
+        # POSITIONS_REFRESH_INTERVAL seconds or an order has been sent
+        self._positions_snapshot = ()
+        self._symbol_position_counts = Counter()
+        self._positions_snapshot_ts = 0.0
+        self._positions_dirty = True
+        self._positions_refresh_interval = float(
+            self.config.get('POSITIONS_REFRESH_INTERVAL', 5)
+        )
+        
+        # Thread pool for read-only broker I/O (ticks, rates, signal analysis).
+        # The MT5 binding releases the GIL during native calls, so threads
+        # overlap broker round-trips. Orders use their own pool below.
+        self._io_pool = ThreadPoolExecutor(max_workers=8)
+        
+        # Orders are submitted in the background and verified at cycle end.
+        # A single worker keeps orders in the risk-checked sequence and
+        # makes the last_error() read in _send_order race-free.
+        self._order_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_acks = []
+        
         # NEW v4.1 COMPONENTS ✨
         self.risk_manager = RiskManager(self.config)
         self.session_manager = TradingSessionManager(self.config)
@@ -85,12 +114,20 @@ class BennerBotV41:
             # Get current account state
             account = mt5.account_info()
             if account is None:
-                logger.error("Failed to get account info")
-                return
+                logger.error("Failed to get account info - reconnecting")
+                if not self._reconnect_with_backoff():
+                    return
+                account = mt5.account_info()
+                if account is None:
+                    logger.error("Failed to get account info after reconnect")
+                    return
             
             current_equity = account.equity
             current_balance = account.balance
             
+            # At most ONE positions fetch per cycle - counted locally
+            self._refresh_positions_snapshot()
+            
             # ════════════════════════════════════════════════════════════════════
             # STEP 1: UPDATE RISK TRACKING (NEW in v4.1) ✨
             # ════════════════════════════════════════════════════════════════════
@@ -98,65 +135,92 @@ class BennerBotV41:
             daily_dd, intraday_dd, kill_switch_triggered = \
                 self.risk_manager.update_drawdown_tracking(current_equity)
             
-            # Log risk status
-            logger.info("=" * 70)
-            logger.info("RISK STATUS UPDATE")
-            logger.info(f"  Current Equity: ${current_equity:,.2f}")
-            logger.info(f"  Daily Drawdown: {daily_dd*100:.2f}% "
-                       f"(Limit: {self.risk_manager.max_daily_drawdown*100:.1f}%)")
-            logger.info(f"  Intraday Drawdown: {intraday_dd*100:.2f}% "
-                       f"(Limit: {self.risk_manager.max_intraday_drawdown*100:.1f}%)")
-            logger.info(f"  Kill Switch Active: {self.risk_manager.kill_switch_active}")
+            # Log risk status (skip formatting entirely when INFO is filtered)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("=" * 70)
+                logger.info("RISK STATUS UPDATE")
+                logger.info(f"  Current Equity: ${current_equity:,.2f}")
+                logger.info("  Daily Drawdown: %.2f%% (Limit: %.1f%%)",
+                            daily_dd * 100, self.risk_manager.max_daily_drawdown * 100)
+                logger.info("  Intraday Drawdown: %.2f%% (Limit: %.1f%%)",
+                            intraday_dd * 100, self.risk_manager.max_intraday_drawdown * 100)
+                logger.info("  Kill Switch Active: %s", self.risk_manager.kill_switch_active)
             
             if kill_switch_triggered:
                 logger.critical("⚠️  KILL SWITCH JUST ACTIVATED!")
             
+            # Manage exits once per cycle for every symbol with open positions,
+            # whether or not it is in session or has a signal this cycle
+            self._manage_open_positions()
+            
+            # No new positions can be opened while the kill switch is active:
+            # skip session filtering and signal generation (exits were managed above)
+            if self.risk_manager.kill_switch_active:
+                logger.info("Kill switch active - skipping signal generation this cycle")
+                self._log_cycle_summary(current_equity, current_balance,
+                                        self._count_open_positions(), [])
+                return
+            
             # ════════════════════════════════════════════════════════════════════
             # STEP 2: GET TRADEABLE SYMBOLS (NEW in v4.1) ✨
             # ════════════════════════════════════════════════════════════════════
             
-            # Get all configured symbols
-            all_mean_reversion_symbols = \
-                self.config['MEAN_REVERSION_SYMBOLS'].split(',')
-            
-            # Filter to only TRADEABLE symbols based on sessions
+            # Filter configured symbols to only TRADEABLE ones based on sessions
             tradeable_symbols = \
                 self.session_manager.get_active_tradeable_symbols(
-                    all_mean_reversion_symbols
+                    self._all_mean_reversion_symbols
                 )
             
-            logger.info(f"Tradeable symbols this cycle: {tradeable_symbols}")
+            logger.info("Tradeable symbols this cycle: %s", tradeable_symbols)
+            
+            # All sessions closed (e.g. weekend) - nothing to analyze
+            if not tradeable_symbols:
+                logger.info("No symbols in an active session - skipping signal generation")
+                self._log_cycle_summary(current_equity, current_balance,
+                                        self._count_open_positions(), tradeable_symbols)
+                return
             
-            # Show which symbols are NOT tradeable (for monitoring)
-            skipped_symbols = set(all_mean_reversion_symbols) - set(tradeable_symbols)
-            if skipped_symbols:
+            # Show which symbols are NOT tradeable (for monitoring only, so
+            # skip the per-symbol session checks when INFO is filtered)
+            if logger.isEnabledFor(logging.INFO):
+                tradeable_set = frozenset(tradeable_symbols)
+                skipped_symbols = [
+                    s for s in self._all_mean_reversion_symbols if s not in tradeable_set
+                ]
                 for symbol in skipped_symbols:
                     can_trade, reason = self.session_manager.can_trade_symbol(symbol)
-                    logger.info(f"  ⏸️  {symbol}: {reason}")
+                    logger.info("  ⏸️  %s: %s", symbol, reason)
             
             # ════════════════════════════════════════════════════════════════════
             # STEP 3: COUNT CURRENT POSITIONS (needed for risk checks)
             # ════════════════════════════════════════════════════════════════════
             
             current_positions = self._count_open_positions()
-            logger.info(f"Current open positions: {current_positions}")
+            logger.info("Current open positions: %d", current_positions)
             
             # ════════════════════════════════════════════════════════════════════
             # STEP 4: PROCESS EACH TRADEABLE SYMBOL
             # ════════════════════════════════════════════════════════════════════
             
+            # Step 4a: Generate trading signals for all symbols in parallel
+            # (read-only market data fetches overlap on the I/O pool)
+            signals = dict(zip(
+                tradeable_symbols,
+                self._io_pool.map(self._analyze_symbol, tradeable_symbols)
+            ))
+            
+            # Decisions and order sending stay sequential so that risk checks
+            # see an up-to-date position count
             for symbol in tradeable_symbols:
-                logger.info(f"\n--- Processing {symbol} ---")
+                logger.info("\n--- Processing %s ---", symbol)
                 
-                # Step 4a: Generate trading signal
-                signal = self.signal_generator.analyze(symbol)
+                signal = signals[symbol]
                 if signal['action'] == 'HOLD':
-                    logger.info(f"{symbol}: No signal (HOLD)")
-                    self._check_exit_conditions(symbol)
+                    logger.info("%s: No signal (HOLD)", symbol)
                     continue
                 
-                logger.info(f"{symbol}: Signal = {signal['action']} "
-                           f"(Tier {signal.get('tier', '?')}) - {signal.get('reason', '')}")
+                logger.info("%s: Signal = %s (Tier %s) - %s", symbol, signal['action'],
+                            signal.get('tier', '?'), signal.get('reason', ''))
                 
                 # Step 4b: Check GLOBAL position limit (NEW in v4.1)
                 can_open, reason = self.risk_manager.can_open_position(
@@ -165,7 +229,7 @@ class BennerBotV41:
                 )
                 
                 if not can_open:
-                    logger.warning(f"  ❌ Cannot open position: {reason}")
+                    logger.warning("  ❌ Cannot open position: %s", reason)
                     continue
                 
                 # Step 4c: Check SYMBOL-SPECIFIC position limit (NEW in v4.1)
@@ -177,52 +241,186 @@ class BennerBotV41:
                     )
                 
                 if not can_open_symbol:
-                    logger.warning(f"  ❌ Cannot open {symbol} position: {reason}")
+                    logger.warning("  ❌ Cannot open %s position: %s", symbol, reason)
                     continue
                 
                 # Step 4d: All checks passed - OPEN POSITION
-                logger.info(f"  ✅ Opening {signal['action']} position for {symbol}")
-                
-                self._open_position(symbol, signal)
-                current_positions += 1  # Update local count
+                logger.info("  ✅ Opening %s position for %s", signal['action'], symbol)
                 
-                # Step 4e: Manage existing positions (take profit, stop loss)
-                self._check_exit_conditions(symbol)
+                # Update local counts only if an order was actually sent
+                if self._open_position(symbol, signal):
+                    current_positions += 1
+                    self._symbol_position_counts[symbol] += 1
             
             # ════════════════════════════════════════════════════════════════════
             # STEP 5: LOG COMPREHENSIVE SUMMARY
             # ════════════════════════════════════════════════════════════════════
             
+            # Verify broker acks for orders submitted this cycle
+            self._collect_order_acks()
+            
             self._log_cycle_summary(current_equity, current_balance, 
                                    current_positions, tradeable_symbols)
             
         except Exception as e:
             logger.error(f"Error in trading cycle: {e}", exc_info=True)
     
+    def _analyze_symbol(self, symbol: str) -> Dict:
+        """
+        Generate a signal for one symbol, turning errors into a HOLD.
+        
+        Runs on the I/O pool; a failure for one symbol must not abort the
+        signals for the rest of the batch.
+        """
+        try:
+            return self.signal_generator.analyze(symbol)
+        except Exception as e:
+            logger.error("Signal generation failed for %s: %s", symbol, e, exc_info=True)
+            return {'action': 'HOLD', 'reason': f"Analysis error: {e}"}
+    
+    def _reconnect_with_backoff(self) -> bool:
+        """
+        Re-initialize the MT5 connection with exponential backoff.
+        
+        Makes up to MAX_API_RETRIES attempts, starting at RETRY_DELAY seconds
+        and doubling the delay each time (capped at 30s).
+        
+        Returns:
+            True if the terminal reconnected, False otherwise
+        """
+        max_attempts = int(self.config.get('MAX_API_RETRIES', 3))
+        delay = float(self.config.get('RETRY_DELAY', 5))
+        
+        for attempt in range(1, max_attempts + 1):
+            mt5.shutdown()
+            time.sleep(delay)
+            
+            if mt5.initialize():
+                logger.info("Reconnected to MT5 (attempt %d/%d)", attempt, max_attempts)
+                self._positions_dirty = True
+                return True
+            
+            logger.warning("MT5 reconnect attempt %d/%d failed: %s",
+                           attempt, max_attempts, mt5.last_error())
+            delay = min(delay * 2, 30)
+        
+        logger.error("Could not reconnect to MT5 after %d attempts", max_attempts)
+        return False
+    
+    def _refresh_positions_snapshot(self):
+        """
+        Fetch open positions and bucket them by symbol.
+        
+        The previous snapshot is reused while it is younger than
+        POSITIONS_REFRESH_INTERVAL and no order has been sent or exit
+        checked since.
+        """
+        now = time.monotonic()
+        if (not self._positions_dirty and
+                now - self._positions_snapshot_ts < self._positions_refresh_interval):
+            return
+        
+        self._positions_snapshot = mt5.positions_get() or ()
+        self._symbol_position_counts = Counter(
+            p.symbol for p in self._positions_snapshot
+        )
+        self._positions_snapshot_ts = now
+        self._positions_dirty = False
+    
     def _count_open_positions(self) -> int:
-        """Count total number of open positions."""
-        positions = mt5.positions_get()
-        return len(positions) if positions else 0
+        """Count total number of open positions (from cycle snapshot)."""
+        return len(self._positions_snapshot)
     
     def _count_positions_for_symbol(self, symbol: str) -> int:
-        """Count open positions for a specific symbol."""
-        positions = mt5.positions_get(symbol=symbol)
-        return len(positions) if positions else 0
+        """Count open positions for a specific symbol (from cycle snapshot)."""
+        return self._symbol_position_counts.get(symbol, 0)
     
-    def _open_position(self, symbol: str, signal: Dict):
+    def _open_position(self, symbol: str, signal: Dict) -> bool:
         """
         Open a new trading position.
         
         This is your existing position opening logic.
         Just needs to be called from the trading cycle with proper checks.
+        
+        The broker round-trip runs on a background worker so the next symbol
+        can be processed while the ack is pending. Results are verified in
+        _collect_order_acks() at the end of the cycle.
+        
+        Returns:
+            True if an order was submitted, False otherwise
+        """
+        request = self._build_order_request(symbol, signal)
+        if request is None:
+            return False
+        
+        future = self._order_pool.submit(self._send_order, request)
+        self._pending_acks.append((symbol, request, future))
+        self._positions_dirty = True
+        return True
+    
+    def _build_order_request(self, symbol: str, signal: Dict) -> Optional[Dict]:
+        """
+        Build the MT5 order request for a signal.
+        
+        This is your existing request building code.
         """
         # Your existing position opening code here
         # Example:
         # lot = self.calculate_lot_size(symbol, signal['tier'])
         # price = self._get_entry_price(symbol, signal)
         # request = {...}
-        # result = mt5.order_send(request)
-        pass
+        # return request
+        return None
+    
+    @staticmethod
+    def _send_order(request: Dict):
+        """
+        Send an order from a worker thread.
+        
+        mt5.last_error() is read right after the call on the single order
+        worker, before another order can overwrite it.
+        
+        Returns:
+            Tuple of (result, last_error) - last_error is None on success
+        """
+        result = mt5.order_send(request)
+        return result, (mt5.last_error() if result is None else None)
+    
+    def _collect_order_acks(self):
+        """Wait for and verify results of orders submitted this cycle."""
+        pending, self._pending_acks = self._pending_acks, []
+        
+        for symbol, request, future in pending:
+            try:
+                result, error = future.result()
+            except Exception as e:
+                logger.error("  ❌ Order send failed for %s: %s", symbol, e)
+                continue
+            
+            if result is None:
+                logger.error("  ❌ Order send failed for %s: %s", symbol, error)
+            elif result.retcode != mt5.TRADE_RETCODE_DONE:
+                logger.error("  ❌ Order rejected for %s: retcode=%s (%s)",
+                             symbol, result.retcode, result.comment)
+            else:
+                logger.info("  ✅ Order filled for %s: ticket %s", symbol, result.order)
+    
+    def _manage_open_positions(self):
+        """
+        Run exit management for every configured symbol with open positions.
+        
+        Positions on other symbols (manual trades, other EAs) are left alone.
+        """
+        counts = self._symbol_position_counts
+        checked = False
+        for symbol in self._all_mean_reversion_symbols:
+            if counts.get(symbol, 0):
+                self._check_exit_conditions(symbol)
+                checked = True
+        
+        # Exits may have closed positions - refetch on the next cycle
+        if checked:
+            self._positions_dirty = True
     
     def _check_exit_conditions(self, symbol: str):
         """
@@ -230,6 +428,8 @@ class BennerBotV41:
         
         This is your existing position management logic.
         Should be called for both open and closed signal periods.
+        _manage_open_positions marks the positions snapshot dirty afterwards,
+        so closes made here are seen on the next cycle.
         """
         # Your existing exit management code here
         pass
@@ -239,26 +439,30 @@ class BennerBotV41:
         """
         Log comprehensive cycle summary for monitoring.
         """
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         risk_summary = self.risk_manager.get_risk_summary(equity)
         session_summary = self.session_manager.get_session_summary()
         
         logger.info("\n" + "=" * 70)
         logger.info("CYCLE SUMMARY")
         logger.info("=" * 70)
-        logger.info(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info(f"\nACCOUNT:")
+        logger.info("\nACCOUNT:")
         logger.info(f"  Balance: ${balance:,.2f}")
         logger.info(f"  Equity: ${equity:,.2f}")
-        logger.info(f"  Daily DD: {risk_summary['daily_drawdown_percent']:.2f}% "
-                   f"/ {risk_summary['max_daily_drawdown_limit']:.1f}%")
-        logger.info(f"  Intraday DD: {risk_summary['intraday_drawdown_percent']:.2f}% "
-                   f"/ {risk_summary['max_intraday_drawdown_limit']:.1f}%")
-        logger.info(f"\nPOSITIONS:")
-        logger.info(f"  Open: {positions} / {risk_summary['max_concurrent_positions']}")
-        logger.info(f"  Max per symbol: {risk_summary['max_positions_per_symbol']}")
-        logger.info(f"  Kill Switch: {risk_summary['kill_switch_active']}")
-        logger.info(f"\nTRADEABLE SYMBOLS:")
-        logger.info(f"  {tradeable_symbols}")
+        logger.info("  Daily DD: %.2f%% / %.1f%%",
+                    risk_summary.daily_drawdown_percent,
+                    risk_summary.max_daily_drawdown_limit)
+        logger.info("  Intraday DD: %.2f%% / %.1f%%",
+                    risk_summary.intraday_drawdown_percent,
+                    risk_summary.max_intraday_drawdown_limit)
+        logger.info("\nPOSITIONS:")
+        logger.info("  Open: %d / %s", positions, risk_summary.max_concurrent_positions)
+        logger.info("  Max per symbol: %s", risk_summary.max_positions_per_symbol)
+        logger.info("  Kill Switch: %s", risk_summary.kill_switch_active)
+        logger.info("\nTRADEABLE SYMBOLS:")
+        logger.info("  %s", tradeable_symbols)
         logger.info("=" * 70 + "\n")
     
     def stop_trading_session(self):
@@ -272,6 +476,12 @@ class BennerBotV41:
             logger.info(f"  Balance: ${account.balance:,.2f}")
             logger.info(f"  Equity: ${account.equity:,.2f}")
         
+        # Verify any outstanding orders and stop background workers
+        # before disconnecting
+        self._collect_order_acks()
+        self._order_pool.shutdown(wait=True)
+        self._io_pool.shutdown(wait=True)
+        
         # Shutdown MT5
         mt5.shutdown()
         logger.info("Trading session ended")
@@ -303,15 +513,24 @@ def main():
         return
     
     # Main loop
-    update_interval = int(bot.config.get('UPDATE_INTERVAL', 60))
+    # Must be positive - deadline alignment divides by it
+    update_interval = max(1, int(bot.config.get('UPDATE_INTERVAL', 60)))
     
     try:
+        # Align cycles to fixed deadlines so cycle duration doesn't add drift
+        next_tick = time.monotonic()
         while True:
+            next_tick += update_interval
             bot.trading_cycle()
             
-            # Wait for next cycle
-            import time
-            time.sleep(update_interval)
+            # Wait for next cycle (minus time spent in this one). If the cycle
+            # overran, skip missed deadlines and wait for the next future one
+            # rather than running back-to-back.
+            now = time.monotonic()
+            if next_tick < now:
+                missed = math.ceil((now - next_tick) / update_interval)
+                next_tick += missed * update_interval
+            time.sleep(max(0, next_tick - now))
             
     except KeyboardInterrupt:
         logger.info("Received interrupt signal")
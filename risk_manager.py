@@ -4,13 +4,47 @@
 # ═══════════════════════════════════════════════════════════════════════════
 
 import logging
-from datetime import datetime, time
+from dataclasses import dataclass, asdict
+from datetime import datetime, time, timedelta
 from typing import Dict, Tuple, Optional, List
 import MetaTrader5 as mt5
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class RiskSnapshot:
+    """
+    Point-in-time risk metrics returned by RiskManager.get_risk_summary().
+    
+    Percent fields are in percent (0-100), matching the config values.
+    """
+    __slots__ = (
+        'session_start_equity', 'session_peak_equity', 'daily_start_equity',
+        'current_equity', 'daily_drawdown_percent', 'intraday_drawdown_percent',
+        'max_daily_drawdown_limit', 'max_intraday_drawdown_limit',
+        'kill_switch_active', 'kill_switch_mode',
+        'max_concurrent_positions', 'max_positions_per_symbol',
+    )
+
+    session_start_equity: Optional[float]
+    session_peak_equity: Optional[float]
+    daily_start_equity: Optional[float]
+    current_equity: float
+    daily_drawdown_percent: float
+    intraday_drawdown_percent: float
+    max_daily_drawdown_limit: float
+    max_intraday_drawdown_limit: float
+    kill_switch_active: bool
+    kill_switch_mode: str
+    max_concurrent_positions: int
+    max_positions_per_symbol: int
+
+    def to_dict(self) -> Dict:
+        """Convert to a plain dictionary (for serialization / telemetry)."""
+        return asdict(self)
+
+
 class RiskManager:
     """
     Manages account-level risk controls including:
@@ -20,6 +54,13 @@ class RiskManager:
     - Equity monitoring and alerts
     """
 
+    # Action logged when the kill switch fires, keyed by KILL_SWITCH_MODE
+    KILL_SWITCH_ACTIONS = {
+        "STOP_OPENING": "🛑 Bot will STOP OPENING new positions but manage existing ones",
+        "PAUSE_TRADING": "🛑 Bot PAUSING ALL TRADING",
+        "EMERGENCY_CLOSE": "🛑 Bot CLOSING ALL POSITIONS IMMEDIATELY",
+    }
+
     def __init__(self, config: Dict):
         """
         Initialize risk manager with configuration.
@@ -33,7 +74,11 @@ class RiskManager:
         self.max_daily_drawdown = config.get('MAX_DAILY_DRAWDOWN_PERCENT', 30) / 100
         self.max_intraday_drawdown = config.get('MAX_INTRADAY_DRAWDOWN_PERCENT', 20) / 100
         self.kill_switch_mode = config.get('KILL_SWITCH_MODE', 'STOP_OPENING')
+        # Mode is fixed after init, so the messages are built once
+        self._kill_switch_reason = f"Kill switch active ({self.kill_switch_mode})"
+        self._kill_switch_action = self.KILL_SWITCH_ACTIONS.get(self.kill_switch_mode)
         self.drawdown_reset_time_str = config.get('DRAWDOWN_RESET_TIME', '00:00')
+        self._reset_time = self._parse_reset_time(self.drawdown_reset_time_str)
         
         # Position limits
         self.max_concurrent_positions = config.get('MAX_CONCURRENT_POSITIONS', 5)
@@ -45,11 +90,26 @@ class RiskManager:
         self.daily_start_equity = None
         self.kill_switch_active = False
         self.last_reset_time = None
+        self._next_reset_dt = None
         
         # Alert settings
         self.enable_drawdown_alerts = config.get('ENABLE_DRAWDOWN_ALERTS', True)
         self.drawdown_alert_thresholds = [75, 50, 25]  # % of limit before triggering alert
-        self.alerts_triggered = {}
+        
+        # Precomputed alert levels as (bit, threshold_pct, drawdown_fraction),
+        # compared directly against the 0-1 drawdown values. Daily alerts use
+        # bits 0..N-1, intraday alerts bits N..2N-1 of self.alerts_mask.
+        n_thresholds = len(self.drawdown_alert_thresholds)
+        self._daily_alert_levels = [
+            (1 << i, pct, (pct / 100) * self.max_daily_drawdown)
+            for i, pct in enumerate(self.drawdown_alert_thresholds)
+        ]
+        self._intraday_alert_levels = [
+            (1 << (n_thresholds + i), pct, (pct / 100) * self.max_intraday_drawdown)
+            for i, pct in enumerate(self.drawdown_alert_thresholds)
+        ]
+        self._all_alerts_mask = (1 << (2 * n_thresholds)) - 1
+        self.alerts_mask = 0
         
         logger.info("RiskManager initialized with:")
         logger.info(f"  Max Daily Drawdown: {self.max_daily_drawdown*100}%")
@@ -68,10 +128,32 @@ class RiskManager:
         self.session_peak_equity = account_balance
         self.daily_start_equity = account_balance
         self.last_reset_time = datetime.now()
+        self._schedule_next_reset(self.last_reset_time)
         self.kill_switch_active = False
+        self.reset_alerts()
         
         logger.info(f"Session initialized - Starting equity: ${account_balance:,.2f}")
 
+    @staticmethod
+    def _parse_reset_time(time_str: str) -> time:
+        """
+        Parse DRAWDOWN_RESET_TIME (HH:MM) once at startup.
+        
+        Args:
+            time_str: Time string in HH:MM format
+            
+        Returns:
+            time object
+            
+        Raises:
+            ValueError: If time format is invalid
+        """
+        try:
+            reset_hour, reset_minute = map(int, time_str.split(':'))
+            return time(reset_hour, reset_minute)
+        except (ValueError, AttributeError) as e:
+            raise ValueError(f"Invalid DRAWDOWN_RESET_TIME '{time_str}': {e}")
+
     def should_reset_daily_drawdown(self) -> bool:
         """
         Check if daily drawdown counter should reset based on DRAWDOWN_RESET_TIME.
@@ -79,26 +161,20 @@ class RiskManager:
         Returns:
             True if reset time has been reached, False otherwise
         """
-        try:
-            reset_hour, reset_minute = map(int, self.drawdown_reset_time_str.split(':'))
-            reset_time = time(reset_hour, reset_minute)
-            current_time = datetime.now().time()
-            
-            # If we haven't recorded last reset or it's past reset time
-            if self.last_reset_time is None:
-                return True
-            
-            last_reset_date = self.last_reset_time.date()
-            current_date = datetime.now().date()
-            
-            # New day and we've passed the reset time
-            if current_date > last_reset_date and current_time >= reset_time:
-                return True
-                
-            return False
-        except Exception as e:
-            logger.error(f"Error checking reset time: {e}")
-            return False
+        # If we haven't scheduled a reset yet, or the scheduled time has passed
+        return self._next_reset_dt is None or datetime.now() >= self._next_reset_dt
+
+    def _schedule_next_reset(self, now: datetime) -> None:
+        """
+        Schedule the next daily drawdown reset at the first DRAWDOWN_RESET_TIME after now.
+        
+        Args:
+            now: Time of the current reset or session start
+        """
+        next_reset = datetime.combine(now.date(), self._reset_time)
+        if next_reset <= now:
+            next_reset += timedelta(days=1)
+        self._next_reset_dt = next_reset
 
     def update_drawdown_tracking(self, current_equity: float) -> Tuple[float, float, bool]:
         """
@@ -115,7 +191,9 @@ class RiskManager:
             self.daily_start_equity = current_equity
             self.session_peak_equity = current_equity
             self.last_reset_time = datetime.now()
+            self._schedule_next_reset(self.last_reset_time)
             self.kill_switch_active = False
+            self.reset_alerts()
             logger.info(f"Daily drawdown reset - New daily equity: ${current_equity:,.2f}")
 
         # Update session peak
@@ -123,14 +201,7 @@ class RiskManager:
             self.session_peak_equity = current_equity
 
         # Calculate drawdowns
-        daily_drawdown = self._calculate_drawdown(
-            current_equity, 
-            self.daily_start_equity
-        )
-        intraday_drawdown = self._calculate_drawdown(
-            current_equity, 
-            self.session_peak_equity
-        )
+        daily_drawdown, intraday_drawdown = self._compute_drawdowns(current_equity)
 
         # Check kill switch conditions
         kill_switch_triggered = False
@@ -148,11 +219,32 @@ class RiskManager:
             self.kill_switch_active = True
 
         # Check alert thresholds (before kill switch activates)
-        if self.enable_drawdown_alerts and not self.kill_switch_active:
+        if (self.enable_drawdown_alerts and not self.kill_switch_active
+                and self.alerts_mask != self._all_alerts_mask):
             self._check_alert_thresholds(daily_drawdown, intraday_drawdown)
 
         return daily_drawdown, intraday_drawdown, kill_switch_triggered
 
+    def _compute_drawdowns(self, current_equity: float) -> Tuple[float, float]:
+        """
+        Calculate daily and intraday drawdowns without updating any state.
+        
+        Args:
+            current_equity: Current account equity
+            
+        Returns:
+            Tuple of (daily_drawdown, intraday_drawdown) as decimals (0-1)
+        """
+        daily_drawdown = self._calculate_drawdown(
+            current_equity, 
+            self.daily_start_equity
+        )
+        intraday_drawdown = self._calculate_drawdown(
+            current_equity, 
+            self.session_peak_equity
+        )
+        return daily_drawdown, intraday_drawdown
+
     def _calculate_drawdown(self, current_equity: float, reference_equity: float) -> float:
         """
         Calculate drawdown percentage.
@@ -183,47 +275,34 @@ class RiskManager:
         )
         logger.critical(f"Kill Switch Mode: {self.kill_switch_mode}")
         
-        if self.kill_switch_mode == "STOP_OPENING":
-            logger.critical("🛑 Bot will STOP OPENING new positions but manage existing ones")
-        elif self.kill_switch_mode == "PAUSE_TRADING":
-            logger.critical("🛑 Bot PAUSING ALL TRADING")
-        elif self.kill_switch_mode == "EMERGENCY_CLOSE":
-            logger.critical("🛑 Bot CLOSING ALL POSITIONS IMMEDIATELY")
+        if self._kill_switch_action:
+            logger.critical(self._kill_switch_action)
 
     def _check_alert_thresholds(self, daily_dd: float, intraday_dd: float) -> None:
         """
         Check if drawdown is approaching limits and trigger alerts.
         
         Args:
-            daily_dd: Daily drawdown percentage
-            intraday_dd: Intraday drawdown percentage
+            daily_dd: Daily drawdown as decimal (0-1)
+            intraday_dd: Intraday drawdown as decimal (0-1)
         """
-        daily_percent = daily_dd * 100
-        intraday_percent = intraday_dd * 100
-        max_daily_percent = self.max_daily_drawdown * 100
-        max_intraday_percent = self.max_intraday_drawdown * 100
-        
-        for threshold_pct in self.drawdown_alert_thresholds:
-            daily_threshold = (threshold_pct / 100) * max_daily_percent
-            intraday_threshold = (threshold_pct / 100) * max_intraday_percent
-            
-            # Daily drawdown alert
-            daily_alert_key = f"daily_{threshold_pct}"
-            if daily_dd >= daily_threshold and daily_alert_key not in self.alerts_triggered:
+        # Daily drawdown alerts
+        for alert_bit, threshold_pct, level in self._daily_alert_levels:
+            if daily_dd >= level and not self.alerts_mask & alert_bit:
                 logger.warning(
-                    f"⚠️  DRAWDOWN ALERT: Daily drawdown {daily_percent:.2f}% "
-                    f"({threshold_pct}% of {max_daily_percent:.1f}% limit)"
+                    f"⚠️  DRAWDOWN ALERT: Daily drawdown {daily_dd*100:.2f}% "
+                    f"({threshold_pct}% of {self.max_daily_drawdown*100:.1f}% limit)"
                 )
-                self.alerts_triggered[daily_alert_key] = True
-            
-            # Intraday drawdown alert
-            intraday_alert_key = f"intraday_{threshold_pct}"
-            if intraday_dd >= intraday_threshold and intraday_alert_key not in self.alerts_triggered:
+                self.alerts_mask |= alert_bit
+        
+        # Intraday drawdown alerts
+        for alert_bit, threshold_pct, level in self._intraday_alert_levels:
+            if intraday_dd >= level and not self.alerts_mask & alert_bit:
                 logger.warning(
-                    f"⚠️  DRAWDOWN ALERT: Intraday drawdown {intraday_percent:.2f}% "
-                    f"({threshold_pct}% of {max_intraday_percent:.1f}% limit)"
+                    f"⚠️  DRAWDOWN ALERT: Intraday drawdown {intraday_dd*100:.2f}% "
+                    f"({threshold_pct}% of {self.max_intraday_drawdown*100:.1f}% limit)"
                 )
-                self.alerts_triggered[intraday_alert_key] = True
+                self.alerts_mask |= alert_bit
 
     def can_open_position(self, current_equity: float, current_positions: int) -> Tuple[bool, str]:
         """
@@ -238,12 +317,7 @@ class RiskManager:
         """
         # Check kill switch
         if self.kill_switch_active:
-            if self.kill_switch_mode == "STOP_OPENING":
-                return False, f"Kill switch active ({self.kill_switch_mode})"
-            elif self.kill_switch_mode == "PAUSE_TRADING":
-                return False, "Kill switch active (PAUSE_TRADING)"
-            elif self.kill_switch_mode == "EMERGENCY_CLOSE":
-                return False, "Kill switch active (EMERGENCY_CLOSE)"
+            return False, self._kill_switch_reason
         
         # Check position limits
         if current_positions >= self.max_concurrent_positions:
@@ -271,34 +345,37 @@ class RiskManager:
         
         return True, "OK"
 
-    def get_risk_summary(self, current_equity: float) -> Dict:
+    def get_risk_summary(self, current_equity: float) -> RiskSnapshot:
         """
         Get comprehensive risk summary.
         
+        Read-only: call update_drawdown_tracking() first to refresh peaks,
+        daily reset and kill switch state.
+        
         Args:
             current_equity: Current account equity
             
         Returns:
-            Dictionary with risk metrics
+            RiskSnapshot with risk metrics (use .to_dict() for a dictionary)
         """
-        daily_dd, intraday_dd, _ = self.update_drawdown_tracking(current_equity)
+        daily_dd, intraday_dd = self._compute_drawdowns(current_equity)
         
-        return {
-            'session_start_equity': self.session_start_equity,
-            'session_peak_equity': self.session_peak_equity,
-            'daily_start_equity': self.daily_start_equity,
-            'current_equity': current_equity,
-            'daily_drawdown_percent': daily_dd * 100,
-            'intraday_drawdown_percent': intraday_dd * 100,
-            'max_daily_drawdown_limit': self.max_daily_drawdown * 100,
-            'max_intraday_drawdown_limit': self.max_intraday_drawdown * 100,
-            'kill_switch_active': self.kill_switch_active,
-            'kill_switch_mode': self.kill_switch_mode,
-            'max_concurrent_positions': self.max_concurrent_positions,
-            'max_positions_per_symbol': self.max_positions_per_symbol
-        }
+        return RiskSnapshot(
+            session_start_equity=self.session_start_equity,
+            session_peak_equity=self.session_peak_equity,
+            daily_start_equity=self.daily_start_equity,
+            current_equity=current_equity,
+            daily_drawdown_percent=daily_dd * 100,
+            intraday_drawdown_percent=intraday_dd * 100,
+            max_daily_drawdown_limit=self.max_daily_drawdown * 100,
+            max_intraday_drawdown_limit=self.max_intraday_drawdown * 100,
+            kill_switch_active=self.kill_switch_active,
+            kill_switch_mode=self.kill_switch_mode,
+            max_concurrent_positions=self.max_concurrent_positions,
+            max_positions_per_symbol=self.max_positions_per_symbol
+        )
 
     def reset_alerts(self) -> None:
         """Reset alert triggers for a new session."""
-        self.alerts_triggered = {}
+        self.alerts_mask = 0
         logger.debug("Alert triggers reset")
@@ -4,13 +4,18 @@
 # ═══════════════════════════════════════════════════════════════════════════
 
 import logging
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime, time, timedelta
+from time import monotonic
 from typing import Dict, Tuple, Optional, List
 import MetaTrader5 as mt5
 from pytz import timezone, UTC
 
 logger = logging.getLogger(__name__)
 
+SECONDS_PER_DAY = 86400
+
 
 class TradingSessionManager:
     """
@@ -41,11 +46,39 @@ class TradingSessionManager:
         
         # Parse session times from config
         self.sessions = self._parse_sessions(config)
-        
-        # Market hours cache (to avoid excessive API calls)
-        self.market_hours_cache = {}
+        self._symbol_index = self._build_symbol_index(self.sessions)
+        self._weekend_symbols = self._build_weekend_symbols()
+        
+        # Per-symbol session schedule sorted by start time:
+        # symbol -> (start_times, [(session_name, session_info), ...])
+        self._sorted_sessions_by_symbol = {}
+        for symbol, symbol_sessions in self._symbol_index.items():
+            ordered = sorted(symbol_sessions, key=lambda x: x[1]['start'])
+            self._sorted_sessions_by_symbol[symbol] = (
+                [info['start'] for _, info in ordered], ordered
+            )
+        
+        # Market hours cache (to avoid excessive API calls):
+        # symbol -> (expires_at_monotonic, result, reason), oldest first
+        self.market_hours_cache = OrderedDict()
+        self.market_hours_cache_ttl = self.market_hours_check_interval * 60  # seconds
+        self.market_hours_cache_max_size = 1024
         self.last_market_check = {}
         
+        # Symbol properties change far less often than ticks:
+        # symbol -> (expires_at_monotonic, point, visible)
+        # The TTL must outlive market_hours_cache, or every liquidity recheck
+        # would find the properties expired too (default: 4 rechecks)
+        self._symbol_info_cache = {}
+        self._symbol_info_ttl = max(
+            config.get('SYMBOL_INFO_CACHE_SECONDS', 4 * self.market_hours_cache_ttl),
+            self.market_hours_cache_ttl
+        )  # seconds
+        
+        # Combined can_trade_symbol results: symbol -> (expires_at_monotonic, can_trade, reason)
+        self.can_trade_cache_ttl = config.get('CAN_TRADE_CACHE_SECONDS', 15)  # seconds
+        self._can_trade_cache = {}
+        
         # UTC timezone for consistency
         self.utc_tz = UTC
         
@@ -127,13 +160,39 @@ class TradingSessionManager:
             except ValueError as e:
                 logger.error(f"Failed to parse crypto session times: {e}")
         
+        # Precompute integer seconds-of-day bounds; the time objects are kept
+        # for display. span_s wraps modulo one day, so sessions crossing
+        # midnight (e.g., 22:00 - 08:00) need no special case.
+        for details in sessions.values():
+            details['start_s'] = self._seconds_of_day(details['start'])
+            details['end_s'] = self._seconds_of_day(details['end'])
+            details['span_s'] = (details['end_s'] - details['start_s']) % SECONDS_PER_DAY
+        
         logger.info(f"Parsed {len(sessions)} trading sessions")
-        for session_name, details in sessions.items():
-            logger.debug(f"  {session_name}: {details['start']} - {details['end']} "
-                        f"(symbols: {', '.join(details['symbols'])})")
+        if logger.isEnabledFor(logging.DEBUG):
+            for session_name, details in sessions.items():
+                logger.debug("  %s: %s - %s (symbols: %s)", session_name,
+                             details['start'], details['end'], ', '.join(details['symbols']))
         
         return sessions
 
+    @staticmethod
+    def _build_symbol_index(sessions: Dict[str, Dict]) -> Dict[str, List[Tuple[str, Dict]]]:
+        """
+        Build a reverse index from symbol to the sessions that trade it.
+        
+        Args:
+            sessions: Parsed sessions from _parse_sessions
+            
+        Returns:
+            Dictionary mapping symbol to list of (session_name, session_info)
+        """
+        index = {}
+        for session_name, session_info in sessions.items():
+            for symbol in session_info['symbols']:
+                index.setdefault(symbol, []).append((session_name, session_info))
+        return index
+
     @staticmethod
     def _parse_time(time_str: str) -> time:
         """
@@ -156,12 +215,26 @@ class TradingSessionManager:
         except (ValueError, AttributeError) as e:
             raise ValueError(f"Cannot parse time '{time_str}': {e}")
 
-    def is_in_trading_session(self, symbol: str) -> Tuple[bool, str]:
+    @staticmethod
+    def _seconds_of_day(t) -> int:
+        """
+        Convert a time of day to integer seconds since midnight.
+        
+        Args:
+            t: time or datetime (only hour/minute/second are used)
+            
+        Returns:
+            Seconds since midnight (0-86399)
+        """
+        return t.hour * 3600 + t.minute * 60 + t.second
+
+    def is_in_trading_session(self, symbol: str, now: Optional[datetime] = None) -> Tuple[bool, str]:
         """
         Check if symbol is in an active trading session.
         
         Args:
             symbol: Trading symbol (e.g., 'EURUSD', 'XAUUSD', 'BTCUSD')
+            now: Current UTC datetime (taken from the clock if not given)
             
         Returns:
             Tuple of (is_trading: bool, session_name: str)
@@ -170,25 +243,32 @@ class TradingSessionManager:
             return True, "Trading sessions disabled"
         
         # Get current UTC time
-        current_utc = datetime.now(self.utc_tz).time()
-        current_date = datetime.now(self.utc_tz).date()
-        current_weekday = datetime.now(self.utc_tz).weekday()  # 0=Monday, 6=Sunday
+        if now is None:
+            now = datetime.now(self.utc_tz)
         
-        # Check each session
-        for session_name, session_info in self.sessions.items():
-            if symbol not in session_info['symbols']:
-                continue
-            
-            start = session_info['start']
-            end = session_info['end']
-            
-            # Handle sessions that cross midnight (e.g., 22:00 - 08:00)
-            if start > end:  # Overnight session
-                in_session = current_utc >= start or current_utc < end
-            else:  # Normal session
-                in_session = start <= current_utc < end
+        return self._is_in_trading_session_at(symbol, self._seconds_of_day(now), now.weekday())
+
+    def _is_in_trading_session_at(
+        self, 
+        symbol: str, 
+        current_s: int, 
+        current_weekday: int
+    ) -> Tuple[bool, str]:
+        """
+        Check symbol sessions against an already-sampled UTC time.
+        
+        Args:
+            symbol: Trading symbol
+            current_s: Current UTC time of day in seconds since midnight
+            current_weekday: Current UTC weekday (0=Monday, 6=Sunday)
             
-            if in_session:
+        Returns:
+            Tuple of (is_trading: bool, session_name: str)
+        """
+        # Check each session that trades this symbol
+        for session_name, session_info in self._symbol_index.get(symbol, ()):
+            # In session when start <= now < end, wrapping past midnight
+            if (current_s - session_info['start_s']) % SECONDS_PER_DAY < session_info['span_s']:
                 # Special handling for weekends
                 if 'CRYPTO' in session_name and current_weekday >= 5:  # Saturday or Sunday
                     if not self.crypto_trade_weekends:
@@ -219,18 +299,19 @@ class TradingSessionManager:
         
         try:
             # Check cache first (avoid excessive API calls)
-            cache_key = f"{symbol}_{datetime.now().strftime('%H:%M')}"
-            if cache_key in self.market_hours_cache:
-                cached_result, cached_reason = self.market_hours_cache[cache_key]
-                return cached_result, cached_reason
+            now = monotonic()
+            cached = self.market_hours_cache.get(symbol)
+            if cached is not None and cached[0] > now:
+                return cached[1], cached[2]
             
-            # Get symbol info from MT5
-            symbol_info = mt5.symbol_info(symbol)
-            if symbol_info is None:
+            # Get symbol properties (cached separately from ticks)
+            info = self._get_symbol_properties(symbol, now)
+            if info is None:
                 return False, f"Symbol not found: {symbol}"
+            point, visible = info
             
             # Check if symbol is visible (available for trading)
-            if not symbol_info.visible:
+            if not visible:
                 return False, "Symbol not visible"
             
             # Check bid-ask spread as liquidity indicator
@@ -238,27 +319,25 @@ class TradingSessionManager:
             if current_tick is None:
                 return False, "Cannot get current tick"
             
-            bid = current_tick.bid
-            ask = current_tick.ask
-            
-            # Get point value (for pip calculation)
-            point = symbol_info.point
+            # Point value is needed for pip calculation
             if point == 0:
                 return False, "Invalid point value"
             
-            # Calculate spread in pips
-            spread_pips = (ask - bid) / point
-            
             # If spread is too wide, market likely closed or low liquidity
-            if spread_pips > self.liquidity_spread_threshold:
-                reason = f"Low liquidity (spread: {spread_pips:.1f} pips, threshold: {self.liquidity_spread_threshold})"
+            spread = current_tick.ask - current_tick.bid
+            if spread > self.liquidity_spread_threshold * point:
+                reason = f"Low liquidity (spread: {spread / point:.1f} pips, threshold: {self.liquidity_spread_threshold})"
                 result = False
             else:
-                reason = f"Active trading (spread: {spread_pips:.1f} pips)"
+                reason = f"Active trading (spread: {spread / point:.1f} pips)"
                 result = True
             
-            # Cache result for this minute
-            self.market_hours_cache[cache_key] = (result, reason)
+            # Cache result for MARKET_HOURS_CHECK_INTERVAL, evicting the oldest
+            # entry if the cache is full
+            self.market_hours_cache[symbol] = (now + self.market_hours_cache_ttl, result, reason)
+            self.market_hours_cache.move_to_end(symbol)
+            if len(self.market_hours_cache) > self.market_hours_cache_max_size:
+                self.market_hours_cache.popitem(last=False)
             
             return result, reason
             
@@ -266,7 +345,62 @@ class TradingSessionManager:
             logger.error(f"Error checking market hours for {symbol}: {e}")
             return False, f"API error: {str(e)}"
 
-    def can_trade_symbol(self, symbol: str) -> Tuple[bool, str]:
+    def _get_symbol_properties(self, symbol: str, now: float) -> Optional[Tuple[float, bool]]:
+        """
+        Get slow-changing symbol properties, refreshing from MT5 after their TTL.
+        
+        Args:
+            symbol: Trading symbol
+            now: Current monotonic time
+            
+        Returns:
+            Tuple of (point, visible) or None if the symbol is not found
+        """
+        cached = self._symbol_info_cache.get(symbol)
+        if cached is not None and cached[0] > now:
+            return cached[1], cached[2]
+        
+        symbol_info = mt5.symbol_info(symbol)
+        if symbol_info is None:
+            return None
+        
+        self._symbol_info_cache[symbol] = (
+            now + self._symbol_info_ttl, symbol_info.point, symbol_info.visible
+        )
+        return symbol_info.point, symbol_info.visible
+
+    def _prefetch_symbol_properties(self, symbols: List[str], now: float) -> None:
+        """
+        Refresh expired symbol properties with one batched MT5 query.
+        
+        Symbols missing from the batch result are left uncached so that
+        _get_symbol_properties falls back to a per-symbol lookup.
+        
+        Args:
+            symbols: Symbols about to be checked
+            now: Current monotonic time
+        """
+        stale = []
+        for symbol in symbols:
+            cached = self._symbol_info_cache.get(symbol)
+            if cached is None or cached[0] <= now:
+                stale.append(symbol)
+        if len(stale) < 2:
+            return
+        
+        try:
+            batch = mt5.symbols_get(group=','.join(stale))
+        except Exception as e:
+            logger.debug("Batched symbol query failed: %s", e)
+            return
+        
+        expires = now + self._symbol_info_ttl
+        for symbol_info in batch or ():
+            self._symbol_info_cache[symbol_info.name] = (
+                expires, symbol_info.point, symbol_info.visible
+            )
+
+    def can_trade_symbol(self, symbol: str, now: Optional[datetime] = None) -> Tuple[bool, str]:
         """
         Determine if trading is allowed for a symbol using all checks.
         
@@ -274,13 +408,51 @@ class TradingSessionManager:
         
         Args:
             symbol: Trading symbol
+            now: UTC datetime to check at; results for an explicit time are
+                 not cached (taken from the clock and cached if not given)
+            
+        Returns:
+            Tuple of (can_trade: bool, reason: str)
+        """
+        if now is not None:
+            return self._evaluate_can_trade(symbol, now)
+        return self._can_trade_cached(symbol, None)
+
+    def _can_trade_cached(self, symbol: str, now: Optional[datetime]) -> Tuple[bool, str]:
+        """
+        can_trade_symbol for the current time, reusing results for
+        CAN_TRADE_CACHE_SECONDS.
+        
+        Args:
+            symbol: Trading symbol
+            now: Clock sample for the current time, or None to take one
+            
+        Returns:
+            Tuple of (can_trade: bool, reason: str)
+        """
+        current = monotonic()
+        cached = self._can_trade_cache.get(symbol)
+        if cached is not None and cached[0] > current:
+            return cached[1], cached[2]
+        
+        can_trade, reason = self._evaluate_can_trade(symbol, now)
+        self._can_trade_cache[symbol] = (current + self.can_trade_cache_ttl, can_trade, reason)
+        return can_trade, reason
+
+    def _evaluate_can_trade(self, symbol: str, now: Optional[datetime]) -> Tuple[bool, str]:
+        """
+        Run the session and API checks for can_trade_symbol without caching.
+        
+        Args:
+            symbol: Trading symbol
+            now: Current UTC datetime (taken from the clock if not given)
             
         Returns:
             Tuple of (can_trade: bool, reason: str)
         """
         # First, check predefined sessions
         if self.enable_trading_sessions:
-            in_session, session_name = self.is_in_trading_session(symbol)
+            in_session, session_name = self.is_in_trading_session(symbol, now)
             if not in_session:
                 return False, f"Outside trading session ({session_name})"
         
@@ -292,6 +464,16 @@ class TradingSessionManager:
         
         return True, "OK - Can trade"
 
+    def invalidate_symbol(self, symbol: str) -> None:
+        """
+        Drop cached trade permission for a symbol so the next check re-evaluates it.
+        
+        Args:
+            symbol: Trading symbol
+        """
+        self._can_trade_cache.pop(symbol, None)
+        self.market_hours_cache.pop(symbol, None)
+
     def get_session_summary(self) -> Dict:
         """
         Get summary of all configured sessions.
@@ -323,19 +505,30 @@ class TradingSessionManager:
         Returns:
             List of symbols that are active 24/7
         """
-        weekend_symbols = []
+        return list(self._weekend_symbols)
+
+    def _build_weekend_symbols(self) -> frozenset:
+        """
+        Collect symbols that can be traded on weekends (sessions are fixed after init).
+        
+        Returns:
+            Frozenset of weekend-tradeable symbols
+        """
+        weekend_symbols = set()
         
         for session_name, session_info in self.sessions.items():
             if 'CRYPTO' in session_name or 'COMMODITY' in session_name:
                 # These are typically 24/5 or 24/7
                 if self.crypto_trade_weekends or 'COMMODITY' in session_name:
-                    weekend_symbols.extend(session_info['symbols'])
+                    weekend_symbols.update(session_info['symbols'])
         
-        return list(set(weekend_symbols))
+        return frozenset(weekend_symbols)
 
     def clear_market_hours_cache(self) -> None:
         """Clear the market hours cache to force API refresh."""
-        self.market_hours_cache = {}
+        self.market_hours_cache.clear()
+        self._symbol_info_cache.clear()
+        self._can_trade_cache.clear()
         logger.info("Market hours cache cleared")
 
     def get_next_session_for_symbol(self, symbol: str) -> Optional[Dict]:
@@ -352,40 +545,32 @@ class TradingSessionManager:
         """
         current_time = datetime.now(self.utc_tz).time()
         
-        # Find sessions for this symbol
-        relevant_sessions = [
-            (name, info) for name, info in self.sessions.items()
-            if symbol in info['symbols']
-        ]
-        
-        if not relevant_sessions:
+        # Sessions for this symbol, pre-sorted by start time
+        schedule = self._sorted_sessions_by_symbol.get(symbol)
+        if schedule is None:
             return None
+        starts, ordered_sessions = schedule
         
-        # Sort by start time
-        relevant_sessions.sort(key=lambda x: x[1]['start'])
-        
-        # Find next session
-        for session_name, session_info in relevant_sessions:
-            if session_info['start'] > current_time:
-                return {
-                    'session_name': session_name,
-                    'start': str(session_info['start']),
-                    'end': str(session_info['end']),
-                    'symbol': symbol
-                }
-        
-        # If no session found today, return first session tomorrow
-        if relevant_sessions:
-            next_session_name, next_session_info = relevant_sessions[0]
+        # Find next session (first start strictly after now)
+        idx = bisect_right(starts, current_time)
+        if idx < len(ordered_sessions):
+            session_name, session_info = ordered_sessions[idx]
             return {
-                'session_name': next_session_name,
-                'start': str(next_session_info['start']),
-                'end': str(next_session_info['end']),
-                'symbol': symbol,
-                'tomorrow': True
+                'session_name': session_name,
+                'start': str(session_info['start']),
+                'end': str(session_info['end']),
+                'symbol': symbol
             }
         
-        return None
+        # If no session found today, return first session tomorrow
+        next_session_name, next_session_info = ordered_sessions[0]
+        return {
+            'session_name': next_session_name,
+            'start': str(next_session_info['start']),
+            'end': str(next_session_info['end']),
+            'symbol': symbol,
+            'tomorrow': True
+        }
 
     def get_active_tradeable_symbols(self, all_symbols: List[str]) -> List[str]:
         """
@@ -397,11 +582,26 @@ class TradingSessionManager:
         Returns:
             List of symbols currently in trading sessions
         """
-        tradeable = []
+        # Sample the clock once for the whole scan
+        now = datetime.now(self.utc_tz)
         
-        for symbol in all_symbols:
-            can_trade, _ = self.can_trade_symbol(symbol)
-            if can_trade:
-                tradeable.append(symbol)
-        
-        return tradeable
+        # Load properties in a single call for the symbols that will reach the
+        # API check this scan: due for re-evaluation, in session, and without
+        # a live market hours result
+        if self.enable_auto_market_hours:
+            current = monotonic()
+            due = []
+            for symbol in all_symbols:
+                cached = self._can_trade_cache.get(symbol)
+                if cached is not None and cached[0] > current:
+                    continue
+                market = self.market_hours_cache.get(symbol)
+                if market is not None and market[0] > current:
+                    continue
+                if self.is_in_trading_session(symbol, now)[0]:
+                    due.append(symbol)
+            if due:
+                self._prefetch_symbol_properties(due, current)
+        
+        # now is a fresh clock sample, so the cached path is safe here
+        return [symbol for symbol in all_symbols if self._can_trade_cached(symbol, now)[0]]